@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+import mmap
 import typing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List
 
 class ConversionError(Exception):
@@ -10,38 +13,77 @@ class ConversionError(Exception):
 class Converter:
     """
     Provides data conversion functionality for common cryptography types.
-    Supported formats: decimal, text (characters), hex (hexadecimal), binary.
+    Supported formats: decimal, text (characters), hex (hexadecimal), binary, bytes.
     """
 
-    def load_data(self, filename: str) -> str:
-        """Load data from a file."""
+    # 8-bit binary string for every byte value, indexed by the byte
+    _BINARY_TABLE = tuple(format(i, "08b") for i in range(256))
+
+    # Conversions that take a single file's contents, usable with batch_convert
+    _BATCH_CONVERSIONS = frozenset({
+        "text_to_decimal", "text_to_hex", "text_to_binary", "text_to_bytes",
+        "hex_to_decimal", "hex_to_text", "hex_to_binary", "hex_to_bytes",
+        "bytes_to_text", "bytes_to_hex", "bytes_to_binary",
+    })
+
+    def load_data(self, filename: str, as_bytes=False) -> typing.Union[str, memoryview]:
+        """
+        Load data from a file.
+        Args:
+            as_bytes: If True, returns a read-only memoryview of the memory-mapped bytes;
+                use it in a with block (or call release()) to unmap the file when done
+        """
         try:
-            with open(filename, "r") as data:
-                return data.read()
+            if not as_bytes:
+                with open(filename, "r") as data:
+                    return data.read()
+            with open(filename, "rb") as data:
+                # mmap refuses empty files
+                if not data.seek(0, 2):
+                    return memoryview(b"")
+                # The view holds the only reference to the map, so releasing it unmaps the file
+                return memoryview(mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ))
         except IOError as e:
             raise ConversionError(f"Failed to read file {filename}: {e}")
 
+    def batch_convert(self, filenames: List[str], op_name: str, max_workers=None) -> list:
+        """
+        Load several files and apply the same conversion to each in parallel processes.
+        Args:
+            op_name: A text_to_*, hex_to_* or bytes_to_* method name, e.g. "hex_to_text" (bytes_to_* get raw file bytes)
+            max_workers: Number of worker processes (defaults to the CPU count)
+        """
+        if op_name not in self._BATCH_CONVERSIONS:
+            raise ConversionError(f"Unsupported batch conversion: '{op_name}'")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_convert_file, filenames, repeat(op_name), repeat(type(self))))
+
     def _validate_decimal_range(self, decimal_list: List[int]) -> None:
         """Validate that decimal values are within the valid range (0-255)."""
+        if not decimal_list or (min(decimal_list) >= 0 and max(decimal_list) <= 255):
+            return
         for decimal in decimal_list:
             if decimal < 0 or decimal > 255:
                 raise ConversionError(f"Decimal value must be between 0-255: {decimal}")
 
+    def _validate_binary_list(self, binary_list: List[str]) -> None:
+        """Validate that every binary string is 8 bits of only 0s and 1s."""
+        # strip() leaves nothing behind only if every character is a 0 or 1
+        if set(map(len, binary_list)) <= {8} and not "".join(binary_list).strip("01"):
+            return
+        for binary in binary_list:
+            if len(binary) != 8 or not all(bit in "01" for bit in binary):
+                raise ConversionError(f"Binary string must be 8 bits with only 0s and 1s: '{binary}'")
+
     def decimal_to_text(self, decimal_list: List[int]) -> str:
         """Convert a list of decimal values to a text string."""
         self._validate_decimal_range(decimal_list)
-        text = ""
-        for i in decimal_list:
-            text += self.d_to_t(i)
-        return text
+        return self.bytes_to_text(bytes(decimal_list))
 
     def decimal_to_binary(self, decimal_list: List[int]) -> List[str]:
         """Convert a list of decimal values to binary strings."""
         self._validate_decimal_range(decimal_list)
-        binary_list = []
-        for i in decimal_list:
-            binary_list.append(self.d_to_b(i))
-        return binary_list
+        return self.bytes_to_binary(bytes(decimal_list))
 
     def decimal_to_hex(self, decimal_list: List[int], as_single_value=False) -> str:
         """
@@ -53,34 +95,30 @@ class Converter:
             return self.d_to_h(decimal_list)
 
         self._validate_decimal_range(decimal_list)
-        hex_string = ""
-        for i in decimal_list:
-            hex_string += self.d_to_h(i)
-        return hex_string
+        return self.bytes_to_hex(bytes(decimal_list))
 
     def text_to_decimal(self, text: str) -> List[int]:
         """Convert a text string to a list of decimal values."""
         text = text.strip("\n")
-        decimal_list = []
-        for i in text:
-            decimal_list.append(self.t_to_d(i))
-        return decimal_list
+        try:
+            return list(self.text_to_bytes(text))
+        except ConversionError:
+            # Characters above 255 keep their full code point
+            return [self.t_to_d(i) for i in text]
 
     def text_to_hex(self, text: str) -> str:
         """Convert a text string to a hex string."""
-        hex_string = ""
-        for i in text:
-            temp_decimal = self.t_to_d(i)
-            hex_string += self.d_to_h(temp_decimal)
-        return hex_string
+        try:
+            return self.bytes_to_hex(self.text_to_bytes(text))
+        except ConversionError:
+            return "".join(self.d_to_h(self.t_to_d(i)) for i in text)
 
     def text_to_binary(self, text: str) -> List[str]:
         """Convert a text string to a list of binary strings."""
-        binary_list = []
-        for i in text:
-            decimal = self.t_to_d(i)
-            binary_list.append(self.d_to_b(decimal))
-        return binary_list
+        try:
+            return self.bytes_to_binary(self.text_to_bytes(text))
+        except ConversionError:
+            return [self.d_to_b(self.t_to_d(i)) for i in text]
 
     def hex_to_decimal(self, hex_string: str, as_single_value=False) -> List[int]:
         """
@@ -88,130 +126,122 @@ class Converter:
         Args:
             as_single_value: If True, interprets the entire string as one large number
         """
-        try:
+        if as_single_value:
+            hex_string = "".join(hex_string.split())
             if hex_string.startswith("0x"):
                 hex_string = hex_string[2:]
-
-            if as_single_value:
+            try:
                 return int(hex_string, 16)
+            except ValueError:
+                raise ConversionError(f"Invalid hex string: '{hex_string}'")
 
-            hex_list = [hex_string[i:i+2] for i in range(0, len(hex_string), 2)]
-            decimal_list = []
-            for i in hex_list:
-                decimal_list.append(int(i, 16))
-            return decimal_list
-        except ValueError:
-            raise ConversionError(f"Invalid hex string: '{hex_string}'")
+        return list(self.hex_to_bytes(hex_string))
 
     def hex_to_text(self, hex_string: str) -> str:
         """Convert a hex string to a text string."""
-        if not hex_string:
-            return ""
-        try:
-            if hex_string.startswith("0x"):
-                hex_string = hex_string[2:]
-            hex_list = [hex_string[i:i+2] for i in range(0, len(hex_string), 2)]
-            text = ""
-            for i in hex_list:
-                temp_decimal = int(i, 16)
-                if temp_decimal < 0 or temp_decimal > 255:
-                    raise ConversionError(f"Hex value must convert to 0-255: '{i}'")
-                text += chr(temp_decimal)
-            return text
-        except ValueError:
-            raise ConversionError(f"Invalid hex string: '{hex_string}'")
+        return self.bytes_to_text(self.hex_to_bytes(hex_string))
 
     def hex_to_binary(self, hex_string: str) -> List[str]:
         """Convert a hex string to a list of binary strings."""
-        try:
-            binary_list = []
-            if hex_string.startswith("0x"):
-                hex_string = hex_string[2:]
-            hex_list = [hex_string[i:i+2] for i in range(0, len(hex_string), 2)]
-            for hex_pair in hex_list:
-                decimal = int(hex_pair, 16)
-                if decimal < 0 or decimal > 255:
-                    raise ConversionError(f"Hex value must convert to 0-255: '{hex_pair}'")
-                binary_list.append(self.d_to_b(decimal))
-            return binary_list
-        except ValueError:
-            raise ConversionError(f"Invalid hex string: '{hex_string}'")
+        return self.bytes_to_binary(self.hex_to_bytes(hex_string))
 
     def binary_to_hex(self, binary_list: List[str]) -> str:
         """Convert a list of binary strings to a hex string."""
-        for binary in binary_list:
-            if len(binary) != 8 or not all(bit in "01" for bit in binary):
-                raise ConversionError(f"Binary string must be 8 bits with only 0s and 1s: '{binary}'")
-        hex_string = ""
-        for binary in binary_list:
-            decimal = self.b_to_d(binary)
-            hex_string += self.d_to_h(decimal)
-        return hex_string
+        return self.bytes_to_hex(self.binary_to_bytes(binary_list))
 
     def binary_to_text(self, binary_list: List[str]) -> str:
         """Convert a list of binary strings to a text string."""
-        for binary in binary_list:
-            if len(binary) != 8 or not all(bit in "01" for bit in binary):
-                raise ConversionError(f"Binary string must be 8 bits with only 0s and 1s: '{binary}'")
-        text = ""
-        for i in binary_list:
-            decimal = self.b_to_d(i)
-            text += self.d_to_t(decimal)
-        return text
+        return self.bytes_to_text(self.binary_to_bytes(binary_list))
 
     def binary_to_decimal(self, binary_list: List[str]) -> List[int]:
         """Convert a list of binary strings to decimal values."""
-        for binary in binary_list:
-            if len(binary) != 8 or not all(bit in "01" for bit in binary):
-                raise ConversionError(f"Binary string must be 8 bits with only 0s and 1s: '{binary}'")
-        decimal_list = []
-        for i in binary_list:
-            decimal_list.append(self.b_to_d(i))
-        return decimal_list
+        return list(self.binary_to_bytes(binary_list))
+
+    def bytes_to_text(self, data: bytes) -> str:
+        """Convert raw bytes to a text string (one character per byte)."""
+        return str(data, "latin-1")
+
+    def bytes_to_hex(self, data: bytes) -> str:
+        """Convert raw bytes to a hex string."""
+        return memoryview(data).hex()
+
+    def bytes_to_binary(self, data: bytes) -> List[str]:
+        """Convert raw bytes to a list of binary strings."""
+        table = self._BINARY_TABLE
+        # Other buffers (e.g. mmap) yield 1-byte bytes when iterated; a memoryview yields ints
+        if not isinstance(data, (bytes, bytearray)):
+            data = memoryview(data)
+        return [table[byte] for byte in data]
+
+    def text_to_bytes(self, text: str) -> bytes:
+        """Convert a text string to raw bytes (one byte per character)."""
+        try:
+            return text.encode("latin-1")
+        except UnicodeEncodeError as e:
+            raise ConversionError(f"Text must only contain characters 0-255: {e.object[e.start]!r}")
+
+    def hex_to_bytes(self, hex_string: str) -> bytes:
+        """Convert a hex string to raw bytes."""
+        # Drop spacing and line breaks so wrapped hex dumps parse as one string
+        hex_string = "".join(hex_string.split())
+        if hex_string.startswith("0x"):
+            hex_string = hex_string[2:]
+        # A trailing odd nibble is its own byte, e.g. "abc" -> ab 0c
+        padded = hex_string
+        if len(padded) % 2:
+            padded = padded[:-1] + "0" + padded[-1]
+        try:
+            return bytes.fromhex(padded)
+        except ValueError:
+            raise ConversionError(f"Invalid hex string: '{hex_string}'")
+
+    def binary_to_bytes(self, binary_list: List[str]) -> bytes:
+        """Convert a list of binary strings to raw bytes."""
+        self._validate_binary_list(binary_list)
+        if not binary_list:
+            return b""
+        # Parse every byte in one pass as a single big integer
+        return int("".join(binary_list), 2).to_bytes(len(binary_list), "big")
 
     def xor_text(self, text_a: str, text_b: str) -> str:
         """XOR two text strings together."""
-        binary_list_a = self.text_to_binary(text_a)
-        binary_list_b = self.text_to_binary(text_b)
-        binary_list_c = []
-        for i in range(min(len(binary_list_a), len(binary_list_b))):
-            binary_list_c.append(self.xor_b(binary_list_a[i], binary_list_b[i]))
-        return self.binary_to_text(binary_list_c)
+        try:
+            return self.bytes_to_text(self.xor_bytes(self.text_to_bytes(text_a), self.text_to_bytes(text_b)))
+        except ConversionError:
+            # Characters above 255 are XORed by their full code point
+            xored = [self.t_to_d(a) ^ self.t_to_d(b) for a, b in zip(text_a, text_b)]
+            for value in xored:
+                if value > 0x10FFFF or 0xD800 <= value <= 0xDFFF:
+                    raise ConversionError(f"XOR result is not a valid character: {value:#x}")
+            return "".join(map(self.d_to_t, xored))
 
     def xor_decimals(self, decimal_list_a: List[int], decimal_list_b: List[int]) -> List[int]:
         """XOR two lists of decimal values together."""
         self._validate_decimal_range(decimal_list_a)
         self._validate_decimal_range(decimal_list_b)
-        xored_decs = []
-        for i in range(min(len(decimal_list_a), len(decimal_list_b))):
-            binary_a = self.d_to_b(decimal_list_a[i])
-            binary_b = self.d_to_b(decimal_list_b[i])
-            xored_binary = self.xor_b(binary_a, binary_b)
-            xored_decs.append(self.b_to_d(xored_binary))
-        return xored_decs
+        length = min(len(decimal_list_a), len(decimal_list_b))
+        return list(self.xor_bytes(bytes(decimal_list_a[:length]), bytes(decimal_list_b[:length])))
+
+    def xor_bytes(self, bytes_a: bytes, bytes_b: bytes) -> bytes:
+        """XOR two byte strings together."""
+        length = min(len(bytes_a), len(bytes_b))
+        # XOR whole machine words at a time by treating each side as one big integer
+        int_a = int.from_bytes(bytes_a[:length], "little")
+        int_b = int.from_bytes(bytes_b[:length], "little")
+        return (int_a ^ int_b).to_bytes(length, "little")
 
     def xor_b(self, binary_a: str, binary_b: str) -> str:
         """XOR two binary strings together."""
-        binary_c = ""
-        for i in range(8):
-            x = int(binary_a[i]) ^ int(binary_b[i])
-            binary_c += str(x)
-        return binary_c
+        self._validate_binary_list([binary_a, binary_b])
+        return format(self.b_to_d(binary_a) ^ self.b_to_d(binary_b), "08b")
 
     def d_to_b(self, decimal: int) -> str:
         """Convert a decimal value to a binary string."""
-        mult = 128
-        binary_string = ""
-        remaining = decimal
-
-        for i in range(8):
-            if remaining - mult >= 0:
-                remaining -= mult
-                binary_string += "1"
-            else:
-                binary_string += "0"
-            mult = mult // 2
-        return binary_string
+        if decimal < 0:
+            raise ConversionError(f"Decimal value must not be negative: {decimal}")
+        if decimal <= 255:
+            return self._BINARY_TABLE[decimal]
+        return format(decimal, "08b")
 
     def d_to_t(self, decimal: int) -> str:
         """Convert a decimal value to a character."""
@@ -219,20 +249,14 @@ class Converter:
 
     def d_to_h(self, decimal: int) -> str:
         """Convert a decimal value to a hex string."""
-        hex_char = hex(decimal)[2:]
-        if len(hex_char) == 1:
-            hex_char = "0" + hex_char
-        return hex_char
+        return format(decimal, "02x")
 
     def b_to_d(self, binary_string: str) -> int:
         """Convert a binary string to a decimal value."""
-        mult = 1
-        decimal = 0
-        for i in reversed(binary_string):
-            if i == "1":
-                decimal += mult
-            mult *= 2
-        return decimal
+        # int() alone would also accept "0b" prefixes, underscores and whitespace
+        if not binary_string or binary_string.strip("01"):
+            raise ConversionError(f"Invalid binary string: '{binary_string}'")
+        return int(binary_string, 2)
 
     def t_to_d(self, text: str) -> int:
         """Convert a character to its decimal value."""
@@ -241,3 +265,12 @@ class Converter:
     def h_to_d(self, hex_char: str) -> int:
         """Convert a hex string to a decimal value."""
         return int(hex_char, 16)
+
+
+def _convert_file(filename: str, op_name: str, converter_class: typing.Type[Converter]):
+    """Worker for Converter.batch_convert: load one file and convert it."""
+    converter = converter_class()
+    if op_name.startswith("bytes_to_"):
+        with converter.load_data(filename, as_bytes=True) as data:
+            return getattr(converter, op_name)(data)
+    return getattr(converter, op_name)(converter.load_data(filename))